@@ -20,13 +20,14 @@ Key enhancements in this version:
 """
 
 import datetime as dt
-import random
-from collections import deque
-from itertools import islice
+import io
+import threading
+import time
+from functools import lru_cache
 
 import dash
-import pandas as pd
-import plotly.graph_objs as go
+import numpy as np
+from plotly.subplots import make_subplots
 from dash import dcc, html, Input, Output, State
 
 # ---------- Constants & Configuration ----------
@@ -38,9 +39,13 @@ UPDATE_INTERVAL_MS = 500  # Update graphs every 0.5 seconds
 # Data buffer config
 MAX_BUFFER_SIZE = 10000  # Store up to 10,000 data points in server memory
 DEFAULT_DISPLAY_POINTS = 50  # Initially show the last 50 data points
+MAX_PLOTTED_POINTS = 300  # Larger display windows are downsampled (LTTB) before sending
+
+# Status indicator style shared by every status message
+STATUS_BASE_STYLE = {'fontWeight': '700', 'color': 'white'}
 
 # Plotly graph config
-GRAPH_CONFIG = {'displayModeBar': True, 'responsive': True}
+GRAPH_CONFIG = {'displayModeBar': True, 'responsive': True, 'plotGlPixelRatio': 2}
 
 # CSS classes and IDs for layout components
 ID_BTN_TOGGLE_LOG = "btn-toggle-log"
@@ -59,12 +64,11 @@ ID_LINE_SHAPE_RADIO = "line-shape-radio"
 ID_SHOW_MARKERS_RADIO = "show-markers-radio"
 ID_MARKER_SIZE_SLIDER = "marker-size-slider"
 ID_SETTINGS_NOTE = "settings-note"
+ID_SENSORS_GRAPH = "sensors-graph"
+ID_LIVE_STORE = "live-store"  # Newest sample plus the start of the display window
 
 # ---------- App Initialization ----------
-external_stylesheets = [
-    'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css'
-]
-app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
+app = dash.Dash(__name__)
 app.title = APP_TITLE
 
 # FIX 1: RESTORED FULL CSS STYLING BLOCK THAT WAS ACCIDENTALLY REMOVED
@@ -75,6 +79,10 @@ app.index_string = """<!DOCTYPE html>
     <title>{%title%}</title>
     {%favicon%}
     {%css%}
+    <!-- Web font loads without blocking first paint (falls back to the system stack meanwhile) -->
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" media="print" onload="this.media='all'">
     <style>
         /* --- Best Practice Note --- */
         /* In a real-world Dash app, this CSS would be in an 'assets/style.css' file */
@@ -118,6 +126,23 @@ app.index_string = """<!DOCTYPE html>
             font-weight: 600;
             letter-spacing: -0.5px;
         }
+        /* --- Icons --- */
+        /* Inline SVG masks tinted with the text color, so no icon font has to be downloaded. */
+        .icon {
+            display: inline-block;
+            width: 1em;
+            height: 1em;
+            flex-shrink: 0;
+            background-color: currentColor;
+            -webkit-mask: var(--icon) no-repeat center / contain;
+            mask: var(--icon) no-repeat center / contain;
+        }
+        .icon-play { --icon: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24'%3E%3Cpath d='M8 5v14l11-7z'/%3E%3C/svg%3E"); }
+        .icon-pause { --icon: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24'%3E%3Cpath d='M6 19h4V5H6v14zm8-14v14h4V5h-4z'/%3E%3C/svg%3E"); }
+        .icon-download { --icon: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24'%3E%3Cpath d='M19 9h-4V3H9v6H5l7 7 7-7zM5 18v2h14v-2H5z'/%3E%3C/svg%3E"); }
+        .icon-cog { --icon: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24'%3E%3Cpath d='M19.14 12.94c.04-.3.06-.61.06-.94 0-.32-.02-.64-.07-.94l2.03-1.58a.49.49 0 0 0 .12-.61l-1.92-3.32a.49.49 0 0 0-.59-.22l-2.39.96c-.5-.38-1.03-.7-1.62-.94l-.36-2.54a.48.48 0 0 0-.48-.41h-3.84c-.24 0-.43.17-.47.41l-.36 2.54c-.59.24-1.13.57-1.62.94l-2.39-.96a.49.49 0 0 0-.59.22L2.74 8.87c-.12.21-.08.47.12.61l2.03 1.58c-.05.3-.09.63-.09.94s.02.64.07.94l-2.03 1.58a.49.49 0 0 0-.12.61l1.92 3.32c.12.22.37.29.59.22l2.39-.96c.5.38 1.03.7 1.62.94l.36 2.54c.05.24.24.41.48.41h3.84c.24 0 .44-.17.47-.41l.36-2.54c.59-.24 1.13-.56 1.62-.94l2.39.96c.22.08.47 0 .59-.22l1.92-3.32a.49.49 0 0 0-.12-.61l-2.01-1.58zM12 15.6A3.6 3.6 0 1 1 12 8.4a3.6 3.6 0 0 1 0 7.2z'/%3E%3C/svg%3E"); }
+        .icon-satellite-dish { --icon: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24'%3E%3Cpath d='M12 5c-3.87 0-7 3.13-7 7h2c0-2.76 2.24-5 5-5s5 2.24 5 5h2c0-3.87-3.13-7-7-7zm1 9.29c.88-.39 1.5-1.26 1.5-2.29 0-1.38-1.12-2.5-2.5-2.5S9.5 10.62 9.5 12c0 1.02.62 1.9 1.5 2.29v3.3L7.59 21 9 22.41l3-3 3 3L16.41 21 13 17.59v-3.3zM12 1C5.93 1 1 5.93 1 12h2c0-4.97 4.03-9 9-9s9 4.03 9 9h2c0-6.07-4.93-11-11-11z'/%3E%3C/svg%3E"); }
+
         .header-icon {
             font-size: 1.75rem;
             margin-right: 0.75rem;
@@ -194,12 +219,6 @@ app.index_string = """<!DOCTYPE html>
             transition: all 0.3s ease;
         }
 
-        .graph-grid {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 1.5rem;
-        }
-
         /* --- Settings Modal Styles --- */
         .modal-overlay {
             position: fixed;
@@ -281,12 +300,10 @@ app.index_string = """<!DOCTYPE html>
         @media (max-width: 992px) {
             .container { flex-direction: column; height: auto; }
             .sidebar, .main-content { width: 100%; border: 0; }
-            .graph-grid { grid-template-columns: 1fr; }
         }
     </style>
 </head>
 <body>
-    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap">
     {%app_entry%}
     <footer>
         {%config%}
@@ -297,35 +314,122 @@ app.index_string = """<!DOCTYPE html>
 </html>"""
 
 # ---------- Data Buffers (Server-Side) ----------
-time_data = deque(maxlen=MAX_BUFFER_SIZE)
+# Preallocated ring buffers. `buffer_head` is the next slot to write and
+# `buffer_count` the number of valid samples (saturates at MAX_BUFFER_SIZE).
+time_data = np.empty(MAX_BUFFER_SIZE, dtype=np.int64)  # epoch milliseconds, local wall clock
 sensor_data = {
-    's1': deque(maxlen=MAX_BUFFER_SIZE), 's2': deque(maxlen=MAX_BUFFER_SIZE),
-    's3': deque(maxlen=MAX_BUFFER_SIZE), 's4': deque(maxlen=MAX_BUFFER_SIZE),
+    's1': np.empty(MAX_BUFFER_SIZE, dtype=np.float32), 's2': np.empty(MAX_BUFFER_SIZE, dtype=np.float32),
+    's3': np.empty(MAX_BUFFER_SIZE, dtype=np.float32), 's4': np.empty(MAX_BUFFER_SIZE, dtype=np.float32),
 }
+buffer_head = 0
+buffer_count = 0
+# Held while appending a sample or snapshotting the buffers, so readers never see
+# columns of different lengths.
+buffer_lock = threading.Lock()
+
+# Simulator state: one RNG and the latest value of every sensor, updated as a vector.
+rng = np.random.default_rng()
+last_values = np.full(len(sensor_data), 50.0)
 
 # ---------- Helper Functions ----------
 def get_current_time() -> dt.datetime:
     return dt.datetime.now()
 
+def get_current_timestamp_ms() -> int:
+    # Plotly renders numeric 'date' axis values as UTC, so shift by the local UTC offset
+    # to keep showing wall-clock time like the datetime objects used to.
+    now_ms = time.time_ns() // 1_000_000
+    return now_ms + time.localtime(now_ms // 1000).tm_gmtoff * 1000
+
+def get_tail(buffer: np.ndarray, num_points: int) -> np.ndarray:
+    """Return the newest `num_points` samples of a ring buffer, oldest first.
+
+    The result is a view into the buffer unless the window wraps around its end.
+    """
+    num_points = min(num_points, buffer_count)
+    start = (buffer_head - num_points) % MAX_BUFFER_SIZE
+    if start + num_points <= MAX_BUFFER_SIZE:
+        return buffer[start:start + num_points]
+    return np.concatenate((buffer[start:], buffer[:buffer_head]))
+
 def generate_new_data():
-    current_time = get_current_time()
-    time_data.append(current_time)
-    for name, buffer in sensor_data.items():
-        last_val = buffer[-1] if buffer else 50.0
-        new_val = last_val + random.uniform(-2.5, 2.5) - (last_val - 50) * 0.1
-        sensor_data[name].append(max(0, min(120, new_val)))
-
-def create_base_figure(title: str) -> go.Figure:
-    fig = go.Figure()
+    global buffer_head, buffer_count, last_values
+    with buffer_lock:
+        noise = rng.uniform(-2.5, 2.5, size=len(last_values))
+        last_values = np.clip(last_values + noise - (last_values - 50.0) * 0.1, 0.0, 120.0)
+        time_data[buffer_head] = get_current_timestamp_ms()
+        for buffer, value in zip(sensor_data.values(), last_values):
+            buffer[buffer_head] = value
+        buffer_head = (buffer_head + 1) % MAX_BUFFER_SIZE
+        buffer_count = min(buffer_count + 1, MAX_BUFFER_SIZE)
+
+def snapshot_buffers() -> tuple[np.ndarray, list[np.ndarray]]:
+    """Return contiguous, oldest-first copies of the time buffer and every sensor buffer."""
+    with buffer_lock:
+        order = np.arange(buffer_head - buffer_count, buffer_head) % MAX_BUFFER_SIZE
+        return np.take(time_data, order), [np.take(buffer, order) for buffer in sensor_data.values()]
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a series to `n_out` points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept; every bucket in between contributes the point that
+    forms the largest triangle with the previously kept point and the next bucket's mean,
+    which preserves the visual peaks and troughs of the line.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    xf, yf = x.astype(np.float64), y.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)  # n_out - 2 interior buckets
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = xf[end:edges[i + 2]].mean(), yf[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = xf[-1], yf[-1]
+        areas = np.abs((xf[a] - next_x) * (yf[start:end] - yf[a]) - (xf[a] - xf[start:end]) * (next_y - yf[a]))
+        a = start + int(np.argmax(areas))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+def create_base_layout() -> dict:
+    # One 2x2 subplot grid, sensor i drawn on axes x{i}/y{i} (row-major).
+    fig = make_subplots(
+        rows=2, cols=2, subplot_titles=[f'Sensor {i}' for i in range(1, 5)],
+        horizontal_spacing=0.08, vertical_spacing=0.12,
+    )
     fig.update_layout(
-        title={'text': title, 'x': 0.05, 'xanchor': 'left', 'font': {'size': 18}},
-        xaxis_title="Time", yaxis_title="Value", template="plotly_dark",
+        template="plotly_dark", showlegend=False,
         plot_bgcolor='#1F2937', paper_bgcolor='#1F2937', font=dict(color='#F9FAFB'),
-        margin=dict(l=40, r=20, t=50, b=40), height=360,
-        xaxis=dict(gridcolor='rgba(255,255,255,0.1)', zeroline=False),
-        yaxis=dict(gridcolor='rgba(255,255,255,0.1)', zeroline=False),
+        margin=dict(l=40, r=20, t=50, b=40), height=720,
     )
-    return fig
+    fig.update_annotations(font_size=18)
+    fig.update_xaxes(title_text="Time", type='date', gridcolor='rgba(255,255,255,0.1)', zeroline=False)
+    fig.update_yaxes(title_text="Value", gridcolor='rgba(255,255,255,0.1)', zeroline=False)
+    return fig.to_dict()['layout']
+
+# Built once at import and shared between callbacks, so callers must copy before changing it.
+BASE_LAYOUT = create_base_layout()
+
+@lru_cache(maxsize=32)
+def get_trace_style(line_shape: str, show_markers: bool, marker_size: int) -> tuple:
+    # Shared by all four traces and across redraws, so the returned dicts must not be mutated.
+    # WebGL traces render far faster than SVG, but only support straight line segments,
+    # so the spline shape keeps using the SVG renderer.
+    trace_type = 'scatter' if line_shape == 'spline' else 'scattergl'
+    mode = 'lines+markers' if show_markers else 'lines'
+    marker_dict = dict(size=marker_size, color='#3B82F6') if show_markers else {}
+    line_dict = dict(shape=line_shape, width=2, color='#3B82F6')
+    return trace_type, mode, marker_dict, line_dict
+
+@lru_cache(maxsize=1)
+def format_settings_summary(dp: int, line_shape: str, show_markers: str, msize: int) -> str:
+    ls = line_shape.capitalize()
+    markers = 'On' if show_markers == 'on' else 'Off'
+    return f"Displaying last {dp} points | Shape: {ls} | Markers: {markers} (Size: {msize})"
 
 def create_settings_row(label: str, control_component):
     return html.Div([
@@ -336,7 +440,7 @@ def create_settings_row(label: str, control_component):
 # ---------- App Layout ----------
 app.layout = html.Div([
     html.Header(className='header', children=[
-        html.I(className='fa-solid fa-satellite-dish header-icon'),
+        html.I(className='icon icon-satellite-dish header-icon'),
         html.H1('Live Sensor Dashboard', className='header-title')
     ]),
     html.Div(className='container', children=[
@@ -344,8 +448,8 @@ app.layout = html.Div([
             html.Div(className='control-panel', children=[
                 html.H2("Controls", className='panel-title'),
                 html.Button(id=ID_BTN_TOGGLE_LOG, n_clicks=0, className='control-btn'),
-                html.Button([html.I(className='fa-solid fa-cog'), " Settings"], id=ID_BTN_SETTINGS, n_clicks=0, className='control-btn btn-secondary'),
-                html.Button([html.I(className='fa-solid fa-download'), " Export Data"], id=ID_BTN_EXPORT, n_clicks=0, className='control-btn btn-secondary'),
+                html.Button([html.I(className='icon icon-cog'), " Settings"], id=ID_BTN_SETTINGS, n_clicks=0, className='control-btn btn-secondary'),
+                html.Button([html.I(className='icon icon-download'), " Export Data"], id=ID_BTN_EXPORT, n_clicks=0, className='control-btn btn-secondary'),
             ]),
             html.Div(className='status-panel', children=[
                 html.H2("Status", className='panel-title'),
@@ -353,12 +457,7 @@ app.layout = html.Div([
             ]),
         ]),
         html.Main(className='main-content', children=[
-            html.Div(className='graph-grid', children=[
-                dcc.Graph(id='sensor1-graph', config=GRAPH_CONFIG),
-                dcc.Graph(id='sensor2-graph', config=GRAPH_CONFIG),
-                dcc.Graph(id='sensor3-graph', config=GRAPH_CONFIG),
-                dcc.Graph(id='sensor4-graph', config=GRAPH_CONFIG),
-            ]),
+            dcc.Graph(id=ID_SENSORS_GRAPH, config=GRAPH_CONFIG),
         ]),
     ]),
     html.Div(id=ID_MODAL_CONTAINER, className='modal-overlay', style={'display': 'none'}, children=[
@@ -388,30 +487,28 @@ app.layout = html.Div([
         'display_points': DEFAULT_DISPLAY_POINTS, 'line_shape': 'linear',
         'show_markers': 'off', 'marker_size': 6
     }),
+    dcc.Store(id=ID_LIVE_STORE),
     dcc.Download(id=ID_DOWNLOAD_DATA),
-    dcc.Interval(id=ID_INTERVAL, interval=UPDATE_INTERVAL_MS, n_intervals=0)
+    dcc.Interval(id=ID_INTERVAL, interval=UPDATE_INTERVAL_MS, n_intervals=0, disabled=True)
 ])
 
 # ---------- Callbacks ----------
 
 @app.callback(
     Output(ID_RUNNING_STORE, 'data'),
-    Input(ID_BTN_TOGGLE_LOG, 'n_clicks'),
-    State(ID_RUNNING_STORE, 'data'),
-    prevent_initial_call=True
-)
-def toggle_running_state(n_clicks, is_running):
-    return not is_running
-
-@app.callback(
     Output(ID_SETTINGS_VISIBLE_STORE, 'data'),
+    Input(ID_BTN_TOGGLE_LOG, 'n_clicks'),
     Input(ID_BTN_SETTINGS, 'n_clicks'),
     Input(ID_BTN_CLOSE_MODAL, 'n_clicks'),
+    State(ID_RUNNING_STORE, 'data'),
     State(ID_SETTINGS_VISIBLE_STORE, 'data'),
     prevent_initial_call=True
 )
-def toggle_settings_visibility(settings_clicks, close_clicks, is_visible):
-    return not is_visible
+def toggle_ui_state(toggle_clicks, settings_clicks, close_clicks, is_running, is_visible):
+    # One callback for both toggle buttons; only the store of the clicked control changes.
+    if dash.ctx.triggered_id == ID_BTN_TOGGLE_LOG:
+        return not is_running, dash.no_update
+    return dash.no_update, not is_visible
 
 @app.callback(
     Output(ID_DOWNLOAD_DATA, 'data'),
@@ -419,51 +516,83 @@ def toggle_settings_visibility(settings_clicks, close_clicks, is_visible):
     prevent_initial_call=True
 )
 def export_data_as_csv(n_clicks):
-    df_data = {"timestamp": list(time_data)}
-    df_data.update({name: list(buffer) for name, buffer in sensor_data.items()})
-    df = pd.DataFrame(df_data)
+    times, sensor_columns = snapshot_buffers()
+    timestamps = np.datetime_as_string(times.astype('datetime64[ms]'))
+    values = np.column_stack(sensor_columns)
+    rows = np.column_stack([timestamps.astype(object), values.astype(object)])
+    csv_buffer = io.StringIO()
+    np.savetxt(csv_buffer, rows, fmt='%s' + ',%.4f' * len(sensor_data),
+               header=','.join(['timestamp', *sensor_data]), comments='')
     timestamp = get_current_time().strftime("%Y%m%d_%H%M%S")
-    return dict(content=df.to_csv(index=False), filename=f"sensor_data_{timestamp}.csv")
-
-@app.callback(
+    return dict(content=csv_buffer.getvalue(), filename=f"sensor_data_{timestamp}.csv")
+
+# Pure UI-state translators run in the browser, saving a server round trip per click.
+app.clientside_callback(
+    """
+    function updateToggleButtonUi(isRunning) {
+        const icon = (name) => ({type: 'I', namespace: 'dash_html_components', props: {className: 'icon icon-' + name}});
+        if (isRunning) {
+            return [[icon('pause'), ' Stop Logging'], 'control-btn btn-danger'];
+        }
+        return [[icon('play'), ' Start Logging'], 'control-btn btn-success'];
+    }
+    """,
     Output(ID_BTN_TOGGLE_LOG, 'children'),
     Output(ID_BTN_TOGGLE_LOG, 'className'),
     Input(ID_RUNNING_STORE, 'data')
 )
-def update_toggle_button_ui(is_running):
-    if is_running:
-        return [html.I(className='fa-solid fa-pause'), " Stop Logging"], 'control-btn btn-danger'
-    return [html.I(className='fa-solid fa-play'), " Start Logging"], 'control-btn btn-success'
 
 @app.callback(
     Output(ID_STATUS_DIV, 'children'),
     Output(ID_STATUS_DIV, 'style'),
-    Input(ID_RUNNING_STORE, 'data'),
-    Input(ID_BTN_EXPORT, 'n_clicks')
+    Input(ID_RUNNING_STORE, 'data')
 )
-def update_status_display(is_running, export_clicks):
-    base_style = {'fontWeight': '700', 'color': 'white'}
-    if dash.ctx.triggered_id == ID_BTN_EXPORT:
-        return "Exported CSV", {**base_style, 'backgroundColor': 'var(--accent-color)'}
-    if not time_data:
-        return "Waiting for data...", {**base_style, 'backgroundColor': '#6B7280'}
+def update_status_on_run_toggle(is_running):
+    if not buffer_count:
+        return "Waiting for data...", {**STATUS_BASE_STYLE, 'backgroundColor': '#6B7280'}
     if is_running:
-        return "Logging: RUNNING", {**base_style, 'backgroundColor': 'var(--success-color)'}
-    return "PAUSED - Zoom/Pan Enabled", {**base_style, 'backgroundColor': 'var(--warning-color)'}
+        return "Logging: RUNNING", {**STATUS_BASE_STYLE, 'backgroundColor': 'var(--success-color)'}
+    return "PAUSED - Zoom/Pan Enabled", {**STATUS_BASE_STYLE, 'backgroundColor': 'var(--warning-color)'}
 
 @app.callback(
+    Output(ID_STATUS_DIV, 'children', allow_duplicate=True),
+    Output(ID_STATUS_DIV, 'style', allow_duplicate=True),
+    Input(ID_BTN_EXPORT, 'n_clicks'),
+    prevent_initial_call=True
+)
+def update_status_on_export(n_clicks):
+    return "Exported CSV", {**STATUS_BASE_STYLE, 'backgroundColor': 'var(--accent-color)'}
+
+# The interval only produces data while logging, so stop scheduling ticks while paused.
+app.clientside_callback(
+    """
+    function toggleInterval(isRunning) {
+        return !isRunning;
+    }
+    """,
+    Output(ID_INTERVAL, 'disabled'),
+    Input(ID_RUNNING_STORE, 'data')
+)
+
+app.clientside_callback(
+    """
+    function showHideSettingsModal(isVisible) {
+        return {display: isVisible ? 'flex' : 'none'};
+    }
+    """,
     Output(ID_MODAL_CONTAINER, 'style'),
     Input(ID_SETTINGS_VISIBLE_STORE, 'data')
 )
-def show_hide_settings_modal(is_visible):
-    return {'display': 'flex'} if is_visible else {'display': 'none'}
 
-@app.callback(
+app.clientside_callback(
+    """
+    function toggleMarkerSizeSlider(markerStatus) {
+        return markerStatus === 'off';
+    }
+    """,
     Output(ID_MARKER_SIZE_SLIDER, 'disabled'),
     Input(ID_SHOW_MARKERS_RADIO, 'value')
 )
-def toggle_marker_size_slider(marker_status):
-    return marker_status == 'off'
 
 @app.callback(
     Output(ID_SETTINGS_STORE, 'data'),
@@ -471,74 +600,115 @@ def toggle_marker_size_slider(marker_status):
     Input(ID_LINE_SHAPE_RADIO, 'value'),
     Input(ID_SHOW_MARKERS_RADIO, 'value'),
     Input(ID_MARKER_SIZE_SLIDER, 'value'),
+    State(ID_SETTINGS_STORE, 'data'),
     prevent_initial_call=True
 )
-def sync_settings_to_store(display_points, line_shape, show_markers, marker_size):
-    return {
+def sync_settings_to_store(display_points, line_shape, show_markers, marker_size, current_settings):
+    settings = {
         'display_points': display_points, 'line_shape': line_shape,
         'show_markers': show_markers, 'marker_size': marker_size
     }
+    # e.g. a slider released on its old value: skip the redraw it would trigger.
+    if settings == current_settings:
+        return dash.no_update
+    return settings
 
 @app.callback(
     Output(ID_SETTINGS_NOTE, 'children'),
     Input(ID_SETTINGS_STORE, 'data')
 )
 def update_settings_summary_note(settings):
-    dp = settings.get('display_points', DEFAULT_DISPLAY_POINTS)
-    ls = settings.get('line_shape', 'linear').capitalize()
-    markers = 'On' if settings.get('show_markers') == 'on' else 'Off'
-    msize = settings.get('marker_size', 6)
-    return f"Displaying last {dp} points | Shape: {ls} | Markers: {markers} (Size: {msize})"
+    return format_settings_summary(
+        settings.get('display_points', DEFAULT_DISPLAY_POINTS), settings.get('line_shape', 'linear'),
+        settings.get('show_markers'), settings.get('marker_size', 6),
+    )
 
 @app.callback(
-    Output('sensor1-graph', 'figure'), Output('sensor2-graph', 'figure'),
-    Output('sensor3-graph', 'figure'), Output('sensor4-graph', 'figure'),
-    Input(ID_INTERVAL, 'n_intervals'),
-    State(ID_RUNNING_STORE, 'data'),
-    State(ID_SETTINGS_STORE, 'data'),
-    State('sensor1-graph', 'relayoutData'), State('sensor2-graph', 'relayoutData'),
-    State('sensor3-graph', 'relayoutData'), State('sensor4-graph', 'relayoutData'),
+    Output(ID_SENSORS_GRAPH, 'figure'),
+    Input(ID_SETTINGS_STORE, 'data'),
+    Input(ID_RUNNING_STORE, 'data'),
 )
-def update_graphs(n, is_running, settings, relayout1, relayout2, relayout3, relayout4):
-    if is_running:
-        generate_new_data()
-
+def redraw_graphs(settings, is_running):
+    # Full redraw, only needed when the settings or the logging state change.
+    # Live points are appended by `update_graphs` without rebuilding the figure.
     display_points = settings.get('display_points', DEFAULT_DISPLAY_POINTS)
     line_shape = settings.get('line_shape', 'linear')
     show_markers = settings.get('show_markers') == 'on'
     marker_size = settings.get('marker_size', 6)
 
-    num_points = len(time_data)
-    start_index = max(0, num_points - display_points)
-    x_slice = list(islice(time_data, start_index, num_points))
-    sensor_slices = {name: list(islice(buf, start_index, num_points)) for name, buf in sensor_data.items()}
-
-    mode = 'lines+markers' if show_markers else 'lines'
-    marker_dict = dict(size=marker_size, color='#3B82F6') if show_markers else {}
-    line_dict = dict(shape=line_shape, width=2, color='#3B82F6')
+    # Copy every tail under the lock so the time column and the sensor columns cover the same samples.
+    with buffer_lock:
+        x_slice = get_tail(time_data, display_points).copy()
+        y_slices = [get_tail(buffer, display_points).copy() for buffer in sensor_data.values()]
+    trace_type, mode, marker_dict, line_dict = get_trace_style(line_shape, show_markers, marker_size)
+
+    # Traces are plain dicts: plotly.js reads them as-is, skipping graph_objects validation.
+    traces = []
+    for i, y_slice in enumerate(y_slices, 1):
+        # Every trace always exists (even if empty) so that extendData has a target.
+        x_plot, y_plot = lttb(x_slice, y_slice, MAX_PLOTTED_POINTS)
+        axis_suffix = '' if i == 1 else str(i)
+        traces.append({
+            'type': trace_type, 'x': x_plot, 'y': y_plot, 'mode': mode,
+            'marker': marker_dict, 'line': line_dict,
+            'xaxis': f'x{axis_suffix}', 'yaxis': f'y{axis_suffix}',
+        })
+
+    # plotly.js keeps the user's zoom/pan on every subplot across redraws that share a
+    # `uirevision`; switching it when logging resumes snaps the axes back to the live data.
+    layout = {**BASE_LAYOUT, 'uirevision': 'running' if is_running else 'paused'}
+    return {'data': traces, 'layout': layout}
 
-    def create_trace(x_data, y_data):
-        return go.Scatter(x=x_data, y=y_data, mode=mode, marker=marker_dict, line=line_dict)
-
-    outputs = []
-    relayouts = [relayout1, relayout2, relayout3, relayout4]
-    for i, relayout_data in enumerate(relayouts, 1):
-        sensor_name = f's{i}'
-        fig = create_base_figure(f'Sensor {i}')
-        if x_slice:
-            fig.add_trace(create_trace(x_slice, sensor_slices[sensor_name]))
-
-        # FIX 2: Added checks to prevent KeyError if only one axis is changed
-        # This makes the zoom/pan feature robust and error-free.
-        if not is_running and relayout_data:
-            if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
-                fig.update_layout(xaxis_range=[relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]']])
-            if 'yaxis.range[0]' in relayout_data and 'yaxis.range[1]' in relayout_data:
-                fig.update_layout(yaxis_range=[relayout_data['yaxis.range[0]'], relayout_data['yaxis.range[1]']])
+@app.callback(
+    Output(ID_LIVE_STORE, 'data'),
+    Input(ID_INTERVAL, 'n_intervals'),
+    State(ID_RUNNING_STORE, 'data'),
+    State(ID_SETTINGS_STORE, 'data'),
+    prevent_initial_call=True
+)
+def update_graphs(n, is_running, settings):
+    if not is_running:
+        return dash.no_update
 
-        outputs.append(fig)
+    generate_new_data()
 
-    return tuple(outputs)
+    # Only the newest sample and the time the display window now starts at go over the
+    # wire; the browser appends the sample and trims each trace to that window.
+    display_points = settings.get('display_points', DEFAULT_DISPLAY_POINTS)
+    with buffer_lock:
+        window_start = int(get_tail(time_data, display_points)[0])
+        new_time = int(get_tail(time_data, 1)[0])
+        new_values = [float(get_tail(buffer, 1)[0]) for buffer in sensor_data.values()]
+    return {'x': new_time, 'y': new_values, 'cutoff': window_start}
+
+# A redraw sends LTTB-downsampled traces, so a trace's point count doesn't tell how much time
+# it covers; trim by time instead, keeping the points at or after the window start.
+app.clientside_callback(
+    """
+    function extendSensorTraces(sample) {
+        if (!sample) {
+            return window.dash_clientside.no_update;
+        }
+        const graph = document.querySelector('#sensors-graph .js-plotly-plot');
+        const traces = (graph && graph.data) || [];
+        const indices = sample.y.map((value, i) => i);
+        // x is sorted epoch ms, so binary-search each trace for the first point inside the window
+        const maxPoints = indices.map((i) => {
+            const x = (traces[i] && traces[i].x) || [];
+            let lo = 0, hi = x.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (x[mid] < sample.cutoff) { lo = mid + 1; } else { hi = mid; }
+            }
+            return x.length - lo + 1;
+        });
+        // The format for extendData is (data_dict, trace_indices, max_points)
+        return [{x: indices.map(() => [sample.x]), y: sample.y.map((value) => [value])}, indices, maxPoints];
+    }
+    """,
+    Output(ID_SENSORS_GRAPH, 'extendData'),
+    Input(ID_LIVE_STORE, 'data')
+)
 
 # ---------- Run Application ----------
 if __name__ == '__main__':
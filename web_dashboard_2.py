@@ -19,12 +19,15 @@ Key enhancements in this version:
   previously developed features into a cohesive, powerful application.
 """
 
+import csv
 import datetime as dt
-import random
-from collections import deque
-from itertools import islice
+import io
+import threading
+import time
+from functools import lru_cache
 
 import dash
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
 from dash import dcc, html, Input, Output, State, no_update
@@ -35,19 +38,28 @@ UPDATE_INTERVAL_MS = 500
 MAX_BUFFER_SIZE = 10000
 DEFAULT_DISPLAY_POINTS_DASH = 100
 DEFAULT_DISPLAY_POINTS_DETAIL = 500
+MAX_PLOTTED_POINTS_DETAIL = 2000 # Roughly one point per pixel column; larger windows are LTTB-downsampled
+DETAIL_PLOT_SIZE_PX = (1200, 600) # Approximate plot area of the full-screen detail graph
+MIN_POINT_DISTANCE_PX = 2 # Live points closer than this to the last plotted one are not sent
 
 GRAPH_CONFIG = {'displayModeBar': True, 'responsive': True}
 
 # --- IDs for Multi-Page Structure ---
 ID_URL = 'url'
 ID_PAGE_CONTENT = 'page-content'
+ID_PAGE_DASHBOARD = 'page-dashboard'
+ID_PAGE_DETAIL = 'page-detail' # One detail view, re-pointed at the sensor in the URL
+ID_PAGE_NOT_FOUND = 'page-not-found'
 ID_NAV_HEADER = 'nav-header'
+PAGE_HIDDEN = {'display': 'none'}
 
 # --- IDs for Global Controls & Stores ---
 ID_RUNNING_STORE = "running-store"
 ID_INTERVAL = "interval-component"
 ID_DOWNLOAD_DATA = "download-data"
 ID_BTN_TOGGLE_LOG = "btn-toggle-log" # Lives on dashboard, but controls global state
+ID_LIVE_STORE = "live-store" # Latest sample, pushed into the dashboard graphs in the browser
+ID_LIVE_SINK = "live-sink" # Dummy output for the clientside push
 
 # --- IDs for Dashboard Page ---
 ID_BTN_EXPORT = "btn-export"
@@ -61,8 +73,10 @@ ID_DASH_LINE_SHAPE_RADIO = "dash-line-shape-radio"
 ID_DASH_SHOW_MARKERS_RADIO = "dash-show-markers-radio"
 ID_DASH_MARKER_SIZE_SLIDER = "dash-marker-size-slider"
 ID_DASH_SETTINGS_NOTE = "dash-settings-note"
+ID_DASH_RANGES_STORE = "dash-ranges-store" # Zoomed axis ranges of the four graphs, keyed by sensor index
 
 # --- IDs for Detail Pages ---
+ID_DETAIL_TITLE = 'detail-title'
 ID_DETAIL_GRAPH = 'detail-graph'
 ID_DETAIL_SETTINGS_STORE = 'detail-settings-store'
 ID_DETAIL_CONTROLS_WRAPPER = 'detail-controls-wrapper'
@@ -71,10 +85,12 @@ ID_DETAIL_LINE_SHAPE_RADIO = "detail-line-shape-radio"
 ID_DETAIL_SHOW_MARKERS_RADIO = "detail-show-markers-radio"
 ID_DETAIL_MARKER_SIZE_SLIDER = "detail-marker-size-slider"
 ID_DETAIL_MARKER_SIZE_WRAPPER = 'detail-marker-size-wrapper'
+ID_DETAIL_STREAM_STORE = 'detail-stream-store' # Per client: sensor on the detail graph, cursor plotted up to, last plotted point
+ID_DETAIL_LIVE_STORE = 'detail-live-store' # Newest batch for the detail graph, the start of its display window and the stream state it leads to
 
 # ---------- App Initialization ----------
 external_stylesheets = ['https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css']
-app = dash.Dash(__name__, external_stylesheets=external_stylesheets, suppress_callback_exceptions=True)
+app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
 app.title = APP_TITLE
 
 app.index_string = """<!DOCTYPE html>
@@ -131,30 +147,154 @@ app.index_string = """<!DOCTYPE html>
 <body><link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap">{%app_entry%}<footer>{%config%}{%scripts%}{%renderer%}</footer></body></html>"""
 
 # ---------- Data Buffers (Server-Side - Single Source of Truth) ----------
-time_data = deque(maxlen=MAX_BUFFER_SIZE)
-sensor_data = {
-    f's{i}': deque(maxlen=MAX_BUFFER_SIZE) for i in range(1, 5)
-}
+class RingBuffer:
+    """Fixed-capacity NumPy ring buffer addressed by absolute sample number (`cursor`).
+
+    `window(start, end)` gathers a range into a new array with `np.take`, so callers copy under
+    `buffer_lock` (see `read_samples`) and never hold a view the producer can overwrite.
+    With `width`, each sample is a row of `width` values stored contiguously (row-major).
+    """
+    __slots__ = ('buf', 'n', 'cursor', 'cap')
+
+    def __init__(self, cap, dtype, width=None):
+        self.buf = np.empty(cap if width is None else (cap, width), dtype=dtype)
+        self.cap = cap
+        self.n = 0       # Valid samples, saturates at `cap`
+        self.cursor = 0  # Total samples ever appended; the write slot is `cursor % cap`
+
+    def __len__(self): return self.n
+
+    def append(self, x):
+        self.buf[self.cursor % self.cap] = x
+        self.cursor += 1
+        self.n = min(self.n + 1, self.cap)
+
+    def window(self, start, end):
+        """Copy of the samples numbered [start, end) by `cursor` that are still buffered."""
+        start = max(start, self.cursor - self.n)
+        return np.take(self.buf, np.arange(start, end) % self.cap, axis=0)
+
+SENSOR_NAMES = ('s1', 's2', 's3', 's4')
+SENSOR_COLUMN = {name: col for col, name in enumerate(SENSOR_NAMES)}
+
+time_data = RingBuffer(MAX_BUFFER_SIZE, np.int64) # Epoch nanoseconds, local wall clock
+# One row per tick holding every sensor, so a tick is a single store and a window a single gather
+sensor_data = RingBuffer(MAX_BUFFER_SIZE, np.float32, width=len(SENSOR_NAMES))
+# Held while the producer appends a sample or a reader copies a window, so readers never see
+# the time buffer a sample ahead of the sensor buffer (or its oldest slot already overwritten).
+buffer_lock = threading.Lock()
+
+
+# Simulator state: all sensors advance together as one vector per tick
+rng = np.random.default_rng()
+last_vals = np.full(len(SENSOR_NAMES), 50.0, dtype=np.float32)
+
+# Logging state shared by every client; set/cleared by the toggle button, read by the producer and callbacks
+RUNNING = threading.Event()
 
 # ---------- Helper Functions ----------
 def get_current_time(): return dt.datetime.now()
 
-def generate_new_data():
-    time_data.append(get_current_time())
-    for name, buffer in sensor_data.items():
-        last_val = buffer[-1] if buffer else 50.0
-        new_val = last_val + random.uniform(-2.5, 2.5) - (last_val - 50) * 0.1
-        sensor_data[name].append(max(0, min(120, new_val)))
+def get_current_time_ns():
+    # Shifted by the UTC offset so timestamps read as local wall-clock time, like datetime.now()
+    now_ns = time.time_ns()
+    return now_ns + time.localtime(now_ns // 1_000_000_000).tm_gmtoff * 1_000_000_000
 
-def create_base_figure(title_text="", height=360):
+def format_timestamp(ns): return str(np.datetime64(int(ns), 'ns'))
+
+def as_datetimes(ns_array): return ns_array.view('datetime64[ns]') # Zero-copy, for plotly x axes
+
+def generate_new_data():
+    noise = rng.uniform(-2.5, 2.5, len(last_vals)).astype(np.float32)
+    np.add(last_vals, noise - (last_vals - 50.0) * 0.1, out=last_vals)
+    np.clip(last_vals, 0, 120, out=last_vals)
+    with buffer_lock:
+        time_data.append(get_current_time_ns())
+        sensor_data.append(last_vals)
+
+def produce_samples():
+    # Sole writer of the ring buffers; logging carries on whether or not any browser is polling
+    while True:
+        RUNNING.wait()
+        generate_new_data()
+        time.sleep(UPDATE_INTERVAL_MS / 1000)
+
+def read_samples(points, since=None):
+    """Aligned copies of the newest `points` samples, limited to those numbered from `since` on if given.
+
+    Returns `(end, times, values)`, where `end` is the cursor just past the newest sample and
+    `values` holds one row of sensor readings per timestamp.
+    """
+    with buffer_lock:
+        end = sensor_data.cursor
+        start = end - points if since is None else max(since, end - points)
+        return end, time_data.window(start, end), sensor_data.window(start, end)
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling of (x, y) to `n_out` points.
+
+    Keeps the first and last points; each bucket in between contributes the point forming
+    the largest triangle with the previously kept point and the mean of the next bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3: return x, y
+    xf = (x.astype(np.int64) if x.dtype.kind == 'M' else x).astype(np.float64)
+    yf = y.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp) # n_out - 2 interior buckets
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = xf[end:edges[i + 2]].mean(), yf[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = xf[-1], yf[-1]
+        areas = np.abs((xf[a] - next_x) * (yf[start:end] - yf[a]) - (xf[a] - xf[start:end]) * (next_y - yf[a]))
+        a = start + int(np.argmax(areas))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+def axis_spans(relayout, times, values):
+    """(x span in ns, y span) shown by a graph whose autoranged axes cover `times`/`values`."""
+    relayout = relayout or {}
+    # Zoomed axes report their range in relayoutData; autoranged ones span the display window
+    if 'xaxis.range[0]' in relayout and 'xaxis.range[1]' in relayout:
+        x_span = (pd.Timestamp(relayout['xaxis.range[1]']) - pd.Timestamp(relayout['xaxis.range[0]'])).value
+    else:
+        x_span = int(times[-1] - times[0]) if len(times) else 0
+    if 'yaxis.range[0]' in relayout and 'yaxis.range[1]' in relayout:
+        y_span = relayout['yaxis.range[1]'] - relayout['yaxis.range[0]']
+    else:
+        y_span = float(np.ptp(values)) if len(values) else 0.0
+    return x_span, y_span
+
+def is_within_pixels_of_last_plotted(last, t, v, spans):
+    """True if (t, v) would be drawn less than MIN_POINT_DISTANCE_PX from the `last` plotted point."""
+    x_span, y_span = spans
+    if last is None or x_span <= 0 or y_span <= 0: return False
+    last_t, last_v = last
+    dx_px = abs(int(t) - last_t) / x_span * DETAIL_PLOT_SIZE_PX[0]
+    dy_px = abs(float(v) - last_v) / y_span * DETAIL_PLOT_SIZE_PX[1]
+    return max(dx_px, dy_px) < MIN_POINT_DISTANCE_PX
+
+def build_base_layout():
     fig = go.Figure()
     fig.update_layout(
-        title={'text': title_text, 'x': 0.05, 'xanchor': 'left', 'font': {'size': 18}},
+        title={'text': '', 'x': 0.05, 'xanchor': 'left', 'font': {'size': 18}},
         template="plotly_dark", plot_bgcolor='#1F2937', paper_bgcolor='#1F2937',
-        font=dict(color='#F9FAFB'), margin=dict(l=40, r=20, t=50, b=40), height=height,
+        font=dict(color='#F9FAFB'), margin=dict(l=40, r=20, t=50, b=40),
         xaxis=dict(gridcolor='rgba(255,255,255,0.1)'), yaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
     )
-    return fig
+    return fig.to_dict()['layout']
+
+# Validated (template resolved) once at import; figures are plain dicts layered on top of it
+BASE_LAYOUT = build_base_layout()
+
+def create_base_figure(title_text="", height=360):
+    layout = {**BASE_LAYOUT, 'title': {**BASE_LAYOUT['title'], 'text': title_text}}
+    if height is not None: layout['height'] = height
+    return {'data': [], 'layout': layout}
 
 def create_settings_row(label, control):
     return html.Div([html.Label(label, className='settings-label'), control], className='settings-row')
@@ -188,6 +328,7 @@ def create_layout_dashboard():
             html.Div(className='graph-grid', children=[
                 dcc.Graph(id=f'sensor{i}-graph', config=GRAPH_CONFIG) for i in range(1, 5)
             ]),
+            dcc.Store(id=ID_DASH_RANGES_STORE, data={}),
         ]),
         html.Div(id=ID_MODAL_CONTAINER, className='modal-overlay', style={'display': 'none'}, children=[
             html.Div(className='modal-content', children=[
@@ -203,14 +344,16 @@ def create_layout_dashboard():
         ])
     ])
 
-def create_layout_sensor_detail(sensor_index):
+def create_layout_sensor_detail():
     return html.Div(className='detail-page-container', children=[
         html.Div(className='detail-page-header', children=[
-            html.H1(f'Sensor {sensor_index} - Detailed View', className='detail-page-title'),
+            html.H1(id=ID_DETAIL_TITLE, className='detail-page-title'),
         ]),
         html.Div(className='detail-graph-container', children=[
             dcc.Graph(id=ID_DETAIL_GRAPH, config=GRAPH_CONFIG, style={'height': '100%'})
         ]),
+        dcc.Store(id=ID_DETAIL_STREAM_STORE),
+        dcc.Store(id=ID_DETAIL_LIVE_STORE),
         html.Div(id=ID_DETAIL_CONTROLS_WRAPPER, className='detail-controls-panel', children=[
             create_settings_row('Display Points', dcc.Slider(id=ID_DETAIL_DISPLAY_POINTS_SLIDER, min=100, max=MAX_BUFFER_SIZE, step=100, value=DEFAULT_DISPLAY_POINTS_DETAIL)),
             create_settings_row('Line Shape', dcc.RadioItems(id=ID_DETAIL_LINE_SHAPE_RADIO, options=[{'label': 'Linear', 'value': 'linear'}, {'label': 'Spline', 'value': 'spline'}], value='spline', labelStyle={'marginRight': '12px'})),
@@ -221,14 +364,29 @@ def create_layout_sensor_detail(sensor_index):
         ])
     ])
 
+@lru_cache(maxsize=8)
+def create_nav_links(pathname):
+    nav_links = [dcc.Link('Dashboard', href='/', className='nav-link')]
+    nav_links.extend([dcc.Link(f'Sensor {i}', href=f'/sensor-{i}', className='nav-link') for i in range(1, 5)])
+    for link in nav_links:
+        if link.href == pathname: link.className += ' active'
+    return tuple(nav_links)
+
 # ---------- Main App Layout (Router) ----------
 app.layout = html.Div([
     dcc.Location(id=ID_URL, refresh=False),
     create_navigation_header(),
-    html.Div(id=ID_PAGE_CONTENT),
+    # Every page is mounted once and shown/hidden by the router, so graphs survive navigation
+    html.Div(id=ID_PAGE_CONTENT, children=[
+        html.Div(id=ID_PAGE_DASHBOARD, children=create_layout_dashboard(), style=PAGE_HIDDEN),
+        html.Div(id=ID_PAGE_DETAIL, children=create_layout_sensor_detail(), style=PAGE_HIDDEN),
+        html.Div(id=ID_PAGE_NOT_FOUND, children=html.H1("404: Not found"), style=PAGE_HIDDEN),
+    ]),
     dcc.Store(id=ID_RUNNING_STORE, data=False),
     dcc.Store(id=ID_DASH_SETTINGS_STORE, data={}),
     dcc.Store(id=ID_DETAIL_SETTINGS_STORE, data={}),
+    dcc.Store(id=ID_LIVE_STORE),
+    dcc.Store(id=ID_LIVE_SINK),
     dcc.Download(id=ID_DOWNLOAD_DATA),
     dcc.Interval(id=ID_INTERVAL, interval=UPDATE_INTERVAL_MS, n_intervals=0)
 ])
@@ -237,162 +395,305 @@ app.layout = html.Div([
 
 # --- 1. Main Router and Navigation Callback ---
 @app.callback(
-    Output(ID_PAGE_CONTENT, 'children'),
+    Output(ID_PAGE_DASHBOARD, 'style'),
+    Output(ID_PAGE_DETAIL, 'style'),
+    Output(ID_PAGE_NOT_FOUND, 'style'),
+    Output(ID_DETAIL_TITLE, 'children'),
     Output(ID_NAV_HEADER, 'children'),
     Input(ID_URL, 'pathname')
 )
 def display_page(pathname):
-    nav_links = [dcc.Link('Dashboard', href='/', className='nav-link')]
-    nav_links.extend([dcc.Link(f'Sensor {i}', href=f'/sensor-{i}', className='nav-link') for i in range(1, 5)])
-    for link in nav_links:
-        if link.href == pathname: link.className += ' active'
+    nav_links = list(create_nav_links(pathname))
 
     if pathname and pathname.startswith('/sensor-'):
         try:
             sensor_index = int(pathname.split('-')[-1])
             if 1 <= sensor_index <= 4:
-                return create_layout_sensor_detail(sensor_index), nav_links
+                return PAGE_HIDDEN, {}, PAGE_HIDDEN, f'Sensor {sensor_index} - Detailed View', nav_links
         except (ValueError, IndexError):
             pass # Fall through to 404
     
     if pathname == '/':
-        return create_layout_dashboard(), nav_links
+        return {}, PAGE_HIDDEN, PAGE_HIDDEN, no_update, nav_links
     
-    return html.H1("404: Not found"), nav_links
+    return PAGE_HIDDEN, PAGE_HIDDEN, {}, no_update, nav_links
 
 # --- 2. Global Control Callbacks ---
-@app.callback(Output(ID_RUNNING_STORE, 'data'), Input(ID_BTN_TOGGLE_LOG, 'n_clicks'), State(ID_RUNNING_STORE, 'data'), prevent_initial_call=True)
-def toggle_running_state(n, is_running): return not is_running
+@app.callback(Output(ID_RUNNING_STORE, 'data'), Input(ID_BTN_TOGGLE_LOG, 'n_clicks'))
+def toggle_running_state(n):
+    # The initial call (no clicks yet) only mirrors the server state into a freshly loaded page
+    if n:
+        if RUNNING.is_set(): RUNNING.clear()
+        else: RUNNING.set()
+    return RUNNING.is_set()
 
 @app.callback(Output(ID_BTN_TOGGLE_LOG, 'children'), Output(ID_BTN_TOGGLE_LOG, 'className'), Input(ID_RUNNING_STORE, 'data'))
 def update_toggle_button_ui(is_running):
     if is_running: return [html.I(className='fa-solid fa-pause'), " Stop Logging"], 'control-btn btn-danger'
     return [html.I(className='fa-solid fa-play'), " Start Logging"], 'control-btn btn-success'
 
-@app.callback(Output(ID_STATUS_DIV, 'children'), Output(ID_STATUS_DIV, 'style'), Input(ID_RUNNING_STORE, 'data'), Input(ID_BTN_EXPORT, 'n_clicks'))
-def update_status_display(is_running, export_clicks):
-    base_style = {'fontWeight': '700', 'color': 'white'}
-    if dash.ctx.triggered_id == ID_BTN_EXPORT: return "Exported CSV", {**base_style, 'backgroundColor': 'var(--accent-color)'}
-    if not time_data: return "Waiting for data...", {**base_style, 'backgroundColor': '#6B7280'}
-    if is_running: return "Logging: RUNNING", {**base_style, 'backgroundColor': 'var(--success-color)'}
-    return "PAUSED - Zoom/Pan Enabled", {**base_style, 'backgroundColor': 'var(--warning-color)'}
+STATUS_BASE_STYLE = {'fontWeight': '700', 'color': 'white'}
+
+@app.callback(Output(ID_STATUS_DIV, 'children'), Output(ID_STATUS_DIV, 'style'), Input(ID_RUNNING_STORE, 'data'))
+def update_status_on_run_toggle(is_running):
+    if not time_data: return "Waiting for data...", {**STATUS_BASE_STYLE, 'backgroundColor': '#6B7280'}
+    if is_running: return "Logging: RUNNING", {**STATUS_BASE_STYLE, 'backgroundColor': 'var(--success-color)'}
+    return "PAUSED - Zoom/Pan Enabled", {**STATUS_BASE_STYLE, 'backgroundColor': 'var(--warning-color)'}
+
+@app.callback(Output(ID_STATUS_DIV, 'children', allow_duplicate=True), Output(ID_STATUS_DIV, 'style', allow_duplicate=True),
+              Input(ID_BTN_EXPORT, 'n_clicks'), prevent_initial_call=True)
+def update_status_on_export(n_clicks):
+    return "Exported CSV", {**STATUS_BASE_STYLE, 'backgroundColor': 'var(--accent-color)'}
 
 @app.callback(Output(ID_DOWNLOAD_DATA, 'data'), Input(ID_BTN_EXPORT, 'n_clicks'), prevent_initial_call=True)
 def export_data_as_csv(n_clicks):
-    df_data = {"timestamp": list(time_data)}
-    df_data.update({name: list(buffer) for name, buffer in sensor_data.items()})
-    df = pd.DataFrame(df_data)
+    _, times, values = read_samples(MAX_BUFFER_SIZE)
+    # Fixed schema: format each column once in numpy, then stream rows straight into csv.writer
+    timestamps = np.datetime_as_string(as_datetimes(times), unit='ms')
+    values = np.char.mod('%.4f', values)
+    csv_buffer = io.StringIO()
+    writer = csv.writer(csv_buffer, lineterminator='\n')
+    writer.writerow(['timestamp', *SENSOR_NAMES])
+    writer.writerows(np.column_stack((timestamps, values)))
     timestamp = get_current_time().strftime("%Y%m%d_%H%M%S")
-    return dict(content=df.to_csv(index=False), filename=f"sensor_data_{timestamp}.csv")
+    return dict(content=csv_buffer.getvalue(), filename=f"sensor_data_{timestamp}.csv")
 
 # --- 3. Dashboard Page Callbacks ---
-@app.callback(Output(ID_MODAL_CONTAINER, 'style'), Input(ID_BTN_SETTINGS, 'n_clicks'), Input(ID_BTN_CLOSE_MODAL, 'n_clicks'), prevent_initial_call=True)
-def toggle_settings_modal(n1, n2):
-    is_opening = dash.ctx.triggered_id == ID_BTN_SETTINGS
-    return {'display': 'flex'} if is_opening else {'display': 'none'}
-
-@app.callback(Output(ID_DASH_MARKER_SIZE_SLIDER, 'disabled'), Input(ID_DASH_SHOW_MARKERS_RADIO, 'value'))
-def toggle_dash_marker_slider(marker_status): return marker_status == 'off'
-
-@app.callback(Output(ID_DASH_SETTINGS_STORE, 'data'),
-              [Input(ID_DASH_DISPLAY_POINTS_SLIDER, 'value'), Input(ID_DASH_LINE_SHAPE_RADIO, 'value'),
-               Input(ID_DASH_SHOW_MARKERS_RADIO, 'value'), Input(ID_DASH_MARKER_SIZE_SLIDER, 'value')])
-def sync_dash_settings_to_store(points, shape, markers, size):
-    return {'points': points, 'shape': shape, 'markers': markers, 'size': size}
+@app.callback(Output(ID_MODAL_CONTAINER, 'style'), Input(ID_BTN_SETTINGS, 'n_clicks'), prevent_initial_call=True)
+def open_settings_modal(n): return {'display': 'flex'}
+
+@app.callback(Output(ID_MODAL_CONTAINER, 'style', allow_duplicate=True), Input(ID_BTN_CLOSE_MODAL, 'n_clicks'), prevent_initial_call=True)
+def close_settings_modal(n): return {'display': 'none'}
+
+# Settings controls only reshape their own values, so these run in the browser with no round trip per slider event
+SYNC_SETTINGS_JS = "function syncSettingsToStore(points, shape, markers, size) { return {points: points, shape: shape, markers: markers, size: size}; }"
+
+app.clientside_callback("function toggleDashMarkerSlider(markerStatus) { return markerStatus === 'off'; }",
+                        Output(ID_DASH_MARKER_SIZE_SLIDER, 'disabled'), Input(ID_DASH_SHOW_MARKERS_RADIO, 'value'))
+
+app.clientside_callback(SYNC_SETTINGS_JS, Output(ID_DASH_SETTINGS_STORE, 'data'),
+                        [Input(ID_DASH_DISPLAY_POINTS_SLIDER, 'value'), Input(ID_DASH_LINE_SHAPE_RADIO, 'value'),
+                         Input(ID_DASH_SHOW_MARKERS_RADIO, 'value'), Input(ID_DASH_MARKER_SIZE_SLIDER, 'value')])
+
+# Fold the graphs' zoom events into one store in the browser; only full x+y ranges are kept, as before
+app.clientside_callback(
+    """
+    function collectDashRanges(relayout1, relayout2, relayout3, relayout4, ranges) {
+        const next = Object.assign({}, ranges);
+        window.dash_clientside.callback_context.triggered.forEach(({prop_id, value}) => {
+            const match = /^sensor(\\d)-graph\\./.exec(prop_id);
+            if (!match) { return; }
+            const r = value || {};
+            if ('xaxis.range[0]' in r && 'yaxis.range[0]' in r) {
+                next[match[1]] = {x: [r['xaxis.range[0]'], r['xaxis.range[1]']], y: [r['yaxis.range[0]'], r['yaxis.range[1]']]};
+            } else {
+                delete next[match[1]];
+            }
+        });
+        return JSON.stringify(next) === JSON.stringify(ranges) ? window.dash_clientside.no_update : next;
+    }
+    """,
+    Output(ID_DASH_RANGES_STORE, 'data', allow_duplicate=True),
+    [Input(f'sensor{i}-graph', 'relayoutData') for i in range(1, 5)],
+    State(ID_DASH_RANGES_STORE, 'data'),
+    prevent_initial_call=True)
 
 @app.callback([Output(f'sensor{i}-graph', 'figure') for i in range(1, 5)],
-              Input(ID_INTERVAL, 'n_intervals'),
-              State(ID_RUNNING_STORE, 'data'),
-              State(ID_DASH_SETTINGS_STORE, 'data'),
-              [State(f'sensor{i}-graph', 'relayoutData') for i in range(1, 5)])
-def update_dashboard_graphs(n, is_running, settings, relayout1, relayout2, relayout3, relayout4):
-    if is_running: generate_new_data()
-
+              Output(ID_DASH_RANGES_STORE, 'data'),
+              Input(ID_DASH_SETTINGS_STORE, 'data'),
+              Input(ID_RUNNING_STORE, 'data'),
+              State(ID_DASH_RANGES_STORE, 'data'))
+def init_dashboard_figures(settings, is_running, ranges):
+    # Full redraw on page load, settings change or run toggle; live points arrive via publish_live_samples.
+    ranges = ranges or {}
     settings = settings or {}
     points = settings.get('points', DEFAULT_DISPLAY_POINTS_DASH)
     shape = settings.get('shape', 'linear')
     show_markers = settings.get('markers') == 'on'
     size = settings.get('size', 6)
 
-    num_total = len(time_data)
-    start_idx = max(0, num_total - points)
-    x_slice = list(islice(time_data, start_idx, num_total))
-    
+    # One aligned read for all four sensors; every figure references the same x array
+    _, times, values = read_samples(points)
+    # x as the same fixed-width strings publish_live_samples sends, so pushLiveSamples can compare them
+    x_slice = np.datetime_as_string(as_datetimes(times))
+    y_slices = values.T.copy() # One contiguous row per sensor
+
     mode = 'lines+markers' if show_markers else 'lines'
-    marker_dict = dict(size=size) if show_markers else {}
-    line_dict = dict(shape=shape, width=2)
-    
+    trace_style = {'type': 'scatter', 'mode': mode, 'line': dict(shape=shape, width=2)}
+    if show_markers: trace_style['marker'] = dict(size=size)
+
     outputs = []
-    relayouts = [relayout1, relayout2, relayout3, relayout4]
-    for i, relayout in enumerate(relayouts, 1):
-        sensor_name = f's{i}'
+    for i, y_slice in enumerate(y_slices, 1):
         fig = create_base_figure(f'Sensor {i}')
-        y_slice = list(islice(sensor_data[sensor_name], start_idx, num_total))
-        if x_slice:
-            fig.add_trace(go.Scatter(x=x_slice, y=y_slice, mode=mode, marker=marker_dict, line=line_dict))
-        
-        if not is_running and relayout:
-            if 'xaxis.range[0]' in relayout and 'yaxis.range[0]' in relayout:
-                fig.update_layout(xaxis_range=[relayout['xaxis.range[0]'], relayout['xaxis.range[1]']],
-                                  yaxis_range=[relayout['yaxis.range[0]'], relayout['yaxis.range[1]']])
+        # A new uirevision on resume drops any zoom so the axes follow the incoming points again
+        fig['layout']['uirevision'] = 'running' if is_running else 'paused'
+        # Plain trace dicts skip plotly's per-property validation. Always add the trace, even empty, so extendData has a target
+        fig['data'] = [{**trace_style, 'x': x_slice, 'y': y_slice}]
+
+        axis_ranges = ranges.get(str(i))
+        if not is_running and axis_ranges:
+            layout = fig['layout'] # Per-figure copy, but its axis dicts are shared with BASE_LAYOUT
+            layout['xaxis'] = {**layout['xaxis'], 'range': axis_ranges['x']}
+            layout['yaxis'] = {**layout['yaxis'], 'range': axis_ranges['y']}
         outputs.append(fig)
+    # Zoom kept from before a resume would come back on the next pause, so forget it
+    outputs.append({} if is_running else no_update)
     return outputs
 
+@app.callback(Output(ID_LIVE_STORE, 'data'),
+              Input(ID_INTERVAL, 'n_intervals'),
+              State(ID_DASH_SETTINGS_STORE, 'data'),
+              State(ID_LIVE_STORE, 'data'),
+              prevent_initial_call=True)
+def publish_live_samples(n, settings, last_sample):
+    # Only samples produced since this client's previous tick go over the wire (just the newest on its first tick)
+    points = (settings or {}).get('points', DEFAULT_DISPLAY_POINTS_DASH)
+    if last_sample: end, times, values = read_samples(points, since=last_sample['cursor'])
+    else: end, times, values = read_samples(1)
+    if not len(times): return no_update
+    return {'t': np.datetime_as_string(as_datetimes(times)), 'vals': values.T.copy(), 'points': points, 'cursor': end}
+
+# Append the samples straight into the plotly.js graphs; plotly.js trims each trace to `points`.
+# A redraw resets nothing here, so samples the fresh figure already holds are skipped first;
+# timestamps are fixed-width ISO strings, so string order is time order.
+app.clientside_callback(
+    """
+    function pushLiveSamples(sample) {
+        if (!sample || !window.Plotly) { return window.dash_clientside.no_update; }
+        sample.vals.forEach((values, i) => {
+            const graph = document.querySelector(`#sensor${i + 1}-graph .js-plotly-plot`);
+            if (!graph || !graph.data || !graph.data.length) { return; }
+            const x = graph.data[0].x || [];
+            const newest = x.length ? x[x.length - 1] : '';
+            let first = 0;
+            while (first < sample.t.length && sample.t[first] <= newest) { first++; }
+            if (first === sample.t.length) { return; }
+            Plotly.extendTraces(graph, {x: [sample.t.slice(first)], y: [values.slice(first)]}, [0], sample.points);
+        });
+        return window.dash_clientside.no_update;
+    }
+    """,
+    Output(ID_LIVE_SINK, 'data'),
+    Input(ID_LIVE_STORE, 'data'))
+
 # --- 4. Sensor Detail Page Callbacks ---
-@app.callback(Output(ID_DETAIL_MARKER_SIZE_WRAPPER, 'style'), Input(ID_DETAIL_SHOW_MARKERS_RADIO, 'value'))
-def toggle_detail_marker_slider_visibility(marker_status):
-    return {'display': 'grid'} if marker_status == 'on' else {'display': 'none'}
+app.clientside_callback("function toggleDetailMarkerSliderVisibility(markerStatus) { return {display: markerStatus === 'on' ? 'grid' : 'none'}; }",
+                        Output(ID_DETAIL_MARKER_SIZE_WRAPPER, 'style'), Input(ID_DETAIL_SHOW_MARKERS_RADIO, 'value'))
 
-@app.callback(Output(ID_DETAIL_SETTINGS_STORE, 'data'),
-              [Input(ID_DETAIL_DISPLAY_POINTS_SLIDER, 'value'), Input(ID_DETAIL_LINE_SHAPE_RADIO, 'value'),
-               Input(ID_DETAIL_SHOW_MARKERS_RADIO, 'value'), Input(ID_DETAIL_MARKER_SIZE_SLIDER, 'value')])
-def sync_detail_settings_to_store(points, shape, markers, size):
-    return {'points': points, 'shape': shape, 'markers': markers, 'size': size}
+app.clientside_callback(SYNC_SETTINGS_JS, Output(ID_DETAIL_SETTINGS_STORE, 'data'),
+                        [Input(ID_DETAIL_DISPLAY_POINTS_SLIDER, 'value'), Input(ID_DETAIL_LINE_SHAPE_RADIO, 'value'),
+                         Input(ID_DETAIL_SHOW_MARKERS_RADIO, 'value'), Input(ID_DETAIL_MARKER_SIZE_SLIDER, 'value')])
 
-@app.callback(Output(ID_DETAIL_GRAPH, 'figure'),
-              Output(ID_DETAIL_GRAPH, 'extendData'),
+def detail_sensor_name(pathname):
+    """Sensor shown by the detail view at `pathname`, or None when the URL is not a detail page."""
+    try:
+        sensor_name = f's{int(pathname.split("-")[-1])}'
+    except (ValueError, IndexError, TypeError, AttributeError):
+        return None
+    return sensor_name if sensor_name in SENSOR_COLUMN else None
+
+# Live update: flush every sample produced since this client's last send as one batch.
+# The stream store is only advanced clientside, once the batch is accepted (see extendDetailGraph).
+@app.callback(Output(ID_DETAIL_LIVE_STORE, 'data'),
               Input(ID_INTERVAL, 'n_intervals'),
-              Input(ID_DETAIL_SETTINGS_STORE, 'data'),
+              State(ID_DETAIL_SETTINGS_STORE, 'data'),
               State(ID_URL, 'pathname'),
-              State(ID_RUNNING_STORE, 'data'))
-def update_detail_graph_live(n, settings, pathname, is_running):
-    triggered_id = dash.ctx.triggered_id
-    try:
-        sensor_index = int(pathname.split('-')[-1])
-        sensor_name = f's{sensor_index}'
-    except (ValueError, IndexError, TypeError):
-        return no_update, no_update
-
-    # Scenario 1: Live update, append one point
-    if triggered_id == ID_INTERVAL and is_running and time_data:
-        new_time, new_value = time_data[-1], sensor_data[sensor_name][-1]
-        # The format for extendData is (data_dict, trace_indices, max_points)
-        points_to_keep = settings.get('points', DEFAULT_DISPLAY_POINTS_DETAIL)
-        return no_update, (dict(x=[[new_time]], y=[[new_value]]), [0], points_to_keep)
-
-    # Scenario 2: Page load or settings change, do a full redraw
-    else:
-        settings = settings or {}
-        points = settings.get('points', DEFAULT_DISPLAY_POINTS_DETAIL)
-        shape = settings.get('shape', 'spline')
-        show_markers = settings.get('markers') == 'on'
-        size = settings.get('size', 6)
-
-        num_total = len(time_data)
-        start_idx = max(0, num_total - points)
-        x_slice = list(islice(time_data, start_idx, num_total))
-        y_slice = list(islice(sensor_data[sensor_name], start_idx, num_total))
-        
-        fig = create_base_figure(height=None) # Auto-height for flexbox
-        mode = 'lines+markers' if show_markers else 'lines'
-        marker_dict = dict(size=size) if show_markers else {}
-        line_dict = dict(shape=shape, width=2)
-        
-        if x_slice:
-            fig.add_trace(go.Scatter(x=x_slice, y=y_slice, mode=mode, marker=marker_dict, line=line_dict))
-        
-        return fig, no_update
+              State(ID_DETAIL_GRAPH, 'relayoutData'),
+              State(ID_DETAIL_STREAM_STORE, 'data'),
+              prevent_initial_call=True)
+def stream_detail_graph(n, settings, pathname, relayout, stream):
+    sensor_name = detail_sensor_name(pathname)
+    # Until the redraw for this sensor has landed, there is no cursor to continue from
+    if sensor_name is None or not RUNNING.is_set() or not stream or stream['sensor'] != sensor_name:
+        return no_update
+
+    points_to_keep = (settings or {}).get('points', DEFAULT_DISPLAY_POINTS_DETAIL)
+    # One read serves both the pending samples and the display window the axis spans come from
+    end, times, values = read_samples(points_to_keep)
+    pending = min(end - stream['cursor'], len(times))
+    if pending <= 0: return no_update
+    values = values[:, SENSOR_COLUMN[sensor_name]]
+    spans = axis_spans(relayout, times, values)
+    last = stream['last']
+    new_x, new_y = [], []
+    for new_time, new_value in zip(times[-pending:], values[-pending:]):
+        # Skip points that would overlap the previous one on screen (e.g. a flat signal)
+        if is_within_pixels_of_last_plotted(last, new_time, new_value, spans):
+            continue
+        last = (int(new_time), float(new_value))
+        new_x.append(format_timestamp(new_time))
+        new_y.append(new_value)
+    # Sent even when every new point was filtered out: the window still moved, so old points must go.
+    # `sensor` and `base` identify the stream state the batch was built from; `stream` is the one it leads to.
+    return {'x': new_x, 'y': new_y, 'cutoff': format_timestamp(times[0]),
+            'sensor': sensor_name, 'base': stream['cursor'],
+            'stream': {'sensor': sensor_name, 'cursor': end, 'last': last}}
+
+# The trace mixes LTTB points from the last redraw with raw streamed ones, so a point count can't
+# say how much time it covers. Trim by time instead: keep what is at or after the window's oldest sample.
+# Timestamps are fixed-width ISO strings, so string order is time order.
+# A batch is applied only if it was built from the current stream state: a tick that raced a redraw
+# (for another sensor, or the same one) is dropped, and its samples go out again from the redraw's cursor.
+app.clientside_callback(
+    """
+    function extendDetailGraph(batch, stream) {
+        const noUpdate = window.dash_clientside.no_update;
+        const graph = document.querySelector('#detail-graph .js-plotly-plot');
+        if (!batch || !graph || !graph.data || !graph.data.length) { return [noUpdate, noUpdate]; }
+        if (!stream || batch.sensor !== stream.sensor || batch.base !== stream.cursor) { return [noUpdate, noUpdate]; }
+        const x = graph.data[0].x || [];
+        let lo = 0, hi = x.length;
+        while (lo < hi) { const mid = (lo + hi) >> 1; if (x[mid] < batch.cutoff) { lo = mid + 1; } else { hi = mid; } }
+        // Skip anything the trace already holds, so a batch never plots a sample twice
+        const newest = x.length ? x[x.length - 1] : '';
+        let first = 0;
+        while (first < batch.x.length && batch.x[first] <= newest) { first++; }
+        const newX = batch.x.slice(first), newY = batch.y.slice(first);
+        if (!newX.length && lo === 0) { return [noUpdate, batch.stream]; }
+        // maxPoints of 0 would mean no limit to some plotly versions
+        return [[{x: [newX], y: [newY]}, [0], Math.max(x.length - lo + newX.length, 1)], batch.stream];
+    }
+    """,
+    Output(ID_DETAIL_GRAPH, 'extendData'),
+    Output(ID_DETAIL_STREAM_STORE, 'data', allow_duplicate=True),
+    Input(ID_DETAIL_LIVE_STORE, 'data'),
+    State(ID_DETAIL_STREAM_STORE, 'data'),
+    prevent_initial_call=True)
+
+# Page load, sensor switch or settings change: full redraw
+@app.callback(Output(ID_DETAIL_GRAPH, 'figure'),
+              Output(ID_DETAIL_GRAPH, 'relayoutData'),
+              Output(ID_DETAIL_STREAM_STORE, 'data'),
+              Input(ID_DETAIL_SETTINGS_STORE, 'data'),
+              Input(ID_URL, 'pathname'))
+def redraw_detail_graph(settings, pathname):
+    sensor_name = detail_sensor_name(pathname)
+    if sensor_name is None: return no_update, no_update, no_update
+
+    settings = settings or {}
+    points = settings.get('points', DEFAULT_DISPLAY_POINTS_DETAIL)
+    shape = settings.get('shape', 'spline')
+    show_markers = settings.get('markers') == 'on'
+    size = settings.get('size', 6)
+
+    end, times, values = read_samples(points)
+    x_slice, y_slice = lttb(times, values[:, SENSOR_COLUMN[sensor_name]], MAX_PLOTTED_POINTS_DETAIL)
+    last = (int(x_slice[-1]), float(y_slice[-1])) if x_slice.size else None
+
+    fig = create_base_figure(height=None) # Auto-height for flexbox
+    # WebGL keeps large traces cheap to extend, but scattergl cannot draw splines, so those stay SVG
+    trace = {'type': 'scatter' if shape == 'spline' else 'scattergl',
+             'mode': 'lines+markers' if show_markers else 'lines', 'line': dict(shape=shape, width=2),
+             # x as the same fixed-width strings the stream sends, so the clientside trim can compare them
+             'x': np.datetime_as_string(as_datetimes(x_slice)), 'y': y_slice}
+    if show_markers: trace['marker'] = dict(size=size)
+    # Plain trace dict, like the dashboard's, skips plotly's validation. Always add it, even empty, so extendData has a target
+    fig['data'] = [trace]
+    # The new figure is autoranged, so drop the zoom the previous view left in relayoutData
+    return fig, None, {'sensor': sensor_name, 'cursor': end, 'last': last}
+
 
+threading.Thread(target=produce_samples, name='sample-producer', daemon=True).start()
 
 if __name__ == '__main__':
     app.run(debug=False)